@@ -12,29 +12,39 @@ passphrases. When run without command-line flags it will prompt for:
   - whether to randomize uppercase characters inside each word
   - how many digits, special characters, and mixed-case letters to append
 
-All randomness comes from `secrets.SystemRandom`.
+All randomness comes from the operating system's CSPRNG: characters are
+drawn from `os.urandom` bytes with rejection sampling, and word picks and
+shuffles use `secrets.SystemRandom`.
 """
 
 from __future__ import annotations
 
 import argparse
+import os
 import secrets
 import string
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 SPECIAL_CHARACTERS = "$%^@!&*"
 AMBIGUOUS_CHARACTERS = "l1IO0"
+_MIXED_CASE_ALPHABET = string.ascii_letters
 
-# Fallback words used only if no external word list is available.
-DEFAULT_INLINE_WORDS: List[str] = """
+# Fallback words used only if no external word list is available. Like
+# load_wordlist output, these are lowercase so generators can skip .lower().
+DEFAULT_INLINE_WORDS: List[str] = [
+    word.lower()
+    for word in """
 acorn agency arctic badge beacon blade breeze canyon cedar cobalt comet
 coral delta dusk ember falcon fjord flicker galaxy glimmer harbor ivory
 jasper jungle lagoon lantern linden matrix meadow nickel north oasis
 onyx opal orbit pebble prism quartz ripple river saffron sailboat sierra
 spruce summit thrush timber tundra tulip velvet walnut willow yonder zephyr
 """.split()
+]
 
 DEFAULT_PASSWORD_LENGTH = 16
 DEFAULT_SPECIAL_COUNT = 2
@@ -47,8 +57,11 @@ DEFAULT_PASSPHRASE_DIGIT_COUNT = 2
 DEFAULT_PASSPHRASE_SPECIAL_COUNT = 1
 DEFAULT_PASSPHRASE_MIXED_COUNT = 2
 
+# Shared CSPRNG instance; SystemRandom keeps no state so one is enough.
+_RNG: secrets.SystemRandom = secrets.SystemRandom()
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Configuration:
     """Container for the selected generation settings."""
 
@@ -172,7 +185,7 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def prompt_positive_int(prompt: str, default: int) -> int:
+def _prompt_int(prompt: str, default: int, minimum: int) -> int:
     while True:
         raw = input(f"{prompt} [{default}]: ").strip()
         if not raw:
@@ -182,24 +195,13 @@ def prompt_positive_int(prompt: str, default: int) -> int:
         except ValueError:
             print("Please enter a whole number.")
             continue
-        if value <= 0:
-            print("Value must be positive.")
-            continue
-        return value
-
-
-def prompt_non_negative_int(prompt: str, default: int) -> int:
-    while True:
-        raw = input(f"{prompt} [{default}]: ").strip()
-        if not raw:
-            return default
-        try:
-            value = int(raw)
-        except ValueError:
-            print("Please enter a whole number.")
-            continue
-        if value < 0:
-            print("Value must be zero or positive.")
+        if value < minimum:
+            if minimum == 0:
+                print("Value must be zero or positive.")
+            elif minimum == 1:
+                print("Value must be positive.")
+            else:
+                print(f"Value must be at least {minimum}.")
             continue
         return value
 
@@ -225,7 +227,7 @@ def resolve_positive(
             raise ValueError(f"{prompt_text} must be positive.")
         return value
     if should_prompt:
-        return prompt_positive_int(prompt_text, default)
+        return _prompt_int(prompt_text, default, minimum=1)
     return default
 
 
@@ -237,7 +239,7 @@ def resolve_non_negative(
             raise ValueError(f"{prompt_text} must be zero or positive.")
         return value
     if should_prompt:
-        return prompt_non_negative_int(prompt_text, default)
+        return _prompt_int(prompt_text, default, minimum=0)
     return default
 
 
@@ -366,94 +368,165 @@ def get_pool(base_pool: str, exclude_ambiguous: bool) -> str:
     return "".join(c for c in base_pool if c not in AMBIGUOUS_CHARACTERS)
 
 
-def get_random_mixed_char(rng: secrets.SystemRandom, exclude_ambiguous: bool) -> str:
-    pool = get_pool(string.ascii_letters, exclude_ambiguous)
-    if not pool:
-        # Fallback if all are excluded (unlikely)
-        return rng.choice(string.ascii_letters)
-    return rng.choice(pool)
+def _sample(alphabet: str, n: int, contiguous: bool = False) -> bytes:
+    """Draw ``n`` characters uniformly from the ASCII ``alphabet``.
+
+    Randomness is read from ``os.urandom`` in batches and mapped onto the
+    alphabet with rejection sampling, so every character is equally likely.
+    The result is returned as ASCII-encoded bytes. When ``contiguous`` is set
+    the alphabet must be a run of consecutive code points (e.g. ``"0"``..``"9"``)
+    and bytes are mapped arithmetically instead of by indexing.
+    """
+    encoded = alphabet.encode("ascii")
+    size = len(encoded)
+    if not 0 < size <= 256:
+        raise ValueError("Alphabet must contain between 1 and 256 characters.")
+    first = encoded[0]
+    bound = 256 - (256 % size)
+    picked = bytearray()
+    # Local aliases keep the per-byte loop free of global/attribute lookups.
+    urandom = os.urandom
+    append = picked.append
+    while len(picked) < n:
+        for byte in urandom(max((n - len(picked)) * 2, 32)):
+            if byte >= bound:
+                continue
+            if contiguous:
+                append(first + byte % size)
+            else:
+                append(encoded[byte % size])
+            if len(picked) == n:
+                break
+    return bytes(picked)
+
+
+def _randbelow_small(n: int) -> int:
+    """Return a uniform integer in ``[0, n)`` from single OS random bytes."""
+    if not 0 < n <= 256:
+        return _RNG.randrange(n)
+    bound = 256 - (256 % n)
+    while True:
+        byte = os.urandom(1)[0]
+        if byte < bound:
+            return byte % n
 
 
-def generate_character_password(
+def _sample_digits(n: int, exclude_ambiguous: bool) -> bytes:
+    if exclude_ambiguous:
+        return _sample(get_pool(string.digits, exclude_ambiguous), n)
+    return _sample(string.digits, n, contiguous=True)
+
+
+def _sample_lowercase(n: int, exclude_ambiguous: bool) -> bytes:
+    if exclude_ambiguous:
+        return _sample(get_pool(string.ascii_lowercase, exclude_ambiguous), n)
+    return _sample(string.ascii_lowercase, n, contiguous=True)
+
+
+def generate_character_passwords(
+    n: int,
     length: int,
     special_count: int,
     digit_count: int,
     mixed_case_count: int,
     exclude_ambiguous: bool,
-) -> str:
+) -> List[str]:
+    """Generate ``n`` independent character passwords with shared settings.
+
+    Each character class is sampled for all passwords in one batch and then
+    sliced per password, so bulk callers avoid per-password sampling setup.
+    """
+    if n < 0:
+        raise ValueError("Password count must be zero or positive.")
     ensure_length_valid(length, special_count, digit_count, mixed_case_count)
-    rng = secrets.SystemRandom()
-    password_chars: List[str] = []
+    filler_count = length - (special_count + digit_count + mixed_case_count)
 
     specials_pool = get_pool(SPECIAL_CHARACTERS, exclude_ambiguous)
-    digits_pool = get_pool(string.digits, exclude_ambiguous)
-    lowercase_pool = get_pool(string.ascii_lowercase, exclude_ambiguous)
-
-    password_chars.extend(rng.choice(specials_pool) for _ in range(special_count))
-    password_chars.extend(rng.choice(digits_pool) for _ in range(digit_count))
-    password_chars.extend(
-        get_random_mixed_char(rng, exclude_ambiguous) for _ in range(mixed_case_count)
-    )
+    mixed_pool = get_pool(_MIXED_CASE_ALPHABET, exclude_ambiguous)
+
+    specials = _sample(specials_pool, n * special_count)
+    digits = _sample_digits(n * digit_count, exclude_ambiguous)
+    mixed = _sample(mixed_pool, n * mixed_case_count)
+    fillers = _sample_lowercase(n * filler_count, exclude_ambiguous)
+
+    passwords: List[str] = []
+    for i in range(n):
+        password_chars = (
+            specials[i * special_count : (i + 1) * special_count]
+            + digits[i * digit_count : (i + 1) * digit_count]
+            + mixed[i * mixed_case_count : (i + 1) * mixed_case_count]
+            + fillers[i * filler_count : (i + 1) * filler_count]
+        )
+        # Scatter the characters over a fresh random permutation of the
+        # positions so the class layout differs between passwords.
+        buf = bytearray(length)
+        positions = _RNG.sample(range(length), length)
+        for position, char in zip(positions, password_chars):
+            buf[position] = char
+        passwords.append(buf.decode("ascii"))
+    return passwords
 
-    remaining = length - len(password_chars)
-    password_chars.extend(rng.choice(lowercase_pool) for _ in range(remaining))
 
-    rng.shuffle(password_chars)
-    return "".join(password_chars)
+def generate_character_password(
+    length: int,
+    special_count: int,
+    digit_count: int,
+    mixed_case_count: int,
+    exclude_ambiguous: bool,
+) -> str:
+    return generate_character_passwords(
+        1, length, special_count, digit_count, mixed_case_count, exclude_ambiguous
+    )[0]
 
 
-def load_wordlist(path: Optional[Path]) -> List[str]:
+def load_wordlist(path: Optional[Path]) -> Sequence[str]:
     if path is not None:
         if not path.is_file():
             raise FileNotFoundError(f"Word list not found: {path}")
-        candidate_paths: Iterable[Path] = [path]
+        candidate = path
     else:
-        candidate_paths = [Path(__file__).with_name("eff_short_wordlist_1.txt")]
-
-    for candidate in candidate_paths:
-        if not candidate.is_file():
-            continue
-        words: List[str] = []
-        with candidate.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                parts = line.split()
-                words.append(parts[-1].lower())
+        candidate = Path(__file__).with_name("eff_short_wordlist_1.txt")
+    return _load_wordlist_cached(str(candidate.resolve()))
+
+
+@lru_cache(maxsize=4)
+def _load_wordlist_cached(path_str: str) -> Tuple[str, ...]:
+    candidate = Path(path_str)
+    if candidate.is_file():
+        text = candidate.read_text(encoding="utf-8")
+        # Diceware lists are "<dice>\t<word>"; plain lists are one word per line.
+        words = [
+            stripped.split()[-1].lower()
+            for line in text.splitlines()
+            if (stripped := line.strip()) and not stripped.startswith("#")
+        ]
         if words:
-            return words
+            return tuple(words)
 
-    return list(DEFAULT_INLINE_WORDS)
+    return tuple(DEFAULT_INLINE_WORDS)
 
 
-def randomize_word(
-    word: str, rng: secrets.SystemRandom, randomize: bool, exclude_ambiguous: bool
-) -> str:
-    base = word.lower()
-    if not randomize:
-        return base
-    
-    letters = list(base)
-    valid_indices = []
-    for i, char in enumerate(letters):
-        if exclude_ambiguous:
-            if char.upper() in AMBIGUOUS_CHARACTERS:
-                continue
-        valid_indices.append(i)
-    
-    if not valid_indices:
-        return base
+def randomize_word(word: str, randomize: bool, exclude_ambiguous: bool) -> str:
+    if not randomize or not word:
+        return word
 
-    index = rng.choice(valid_indices)
-    letters[index] = letters[index].upper()
-    return "".join(letters)
+    if exclude_ambiguous:
+        valid_indices = [
+            i for i, char in enumerate(word) if char.upper() not in AMBIGUOUS_CHARACTERS
+        ]
+        if not valid_indices:
+            return word
+        index = valid_indices[_randbelow_small(len(valid_indices))]
+    else:
+        index = _randbelow_small(len(word))
+
+    return word[:index] + word[index].upper() + word[index + 1 :]
 
 
 def generate_passphrase(
     *,
     word_count: int,
-    words: List[str],
+    words: Sequence[str],
     separator: str,
     digit_count: int,
     special_count: int,
@@ -464,45 +537,27 @@ def generate_passphrase(
     if not words:
         raise ValueError("Word list is empty; provide a valid word list.")
 
-    rng = secrets.SystemRandom()
-    selected_words: List[str] = []
-    for _ in range(word_count):
-        word = rng.choice(words)
-        selected_words.append(
-            randomize_word(
-                word, rng, randomize_word_capitalization, exclude_ambiguous
-            )
-        )
-
-    if separator:
-        base = separator.join(selected_words)
+    picks = _RNG.choices(words, k=word_count)
+    if randomize_word_capitalization:
+        selected_words = [
+            randomize_word(word, True, exclude_ambiguous) for word in picks
+        ]
     else:
-        base = "".join(selected_words)
+        # load_wordlist already yields lowercase words.
+        selected_words = picks
 
-    suffix_parts: List[str] = []
-    
-    digits_pool = get_pool(string.digits, exclude_ambiguous)
     specials_pool = get_pool(SPECIAL_CHARACTERS, exclude_ambiguous)
+    mixed_pool = get_pool(_MIXED_CASE_ALPHABET, exclude_ambiguous)
 
-    if digit_count > 0:
-        suffix_parts.append(
-            "".join(rng.choice(digits_pool) for _ in range(digit_count))
-        )
-    if special_count > 0:
-        suffix_parts.append(
-            "".join(rng.choice(specials_pool) for _ in range(special_count))
-        )
-    if mixed_count > 0:
-        suffix_parts.append(
-            "".join(get_random_mixed_char(rng, exclude_ambiguous) for _ in range(mixed_count))
-        )
-
-    if not suffix_parts:
-        return base
+    suffix_groups = (
+        _sample_digits(digit_count, exclude_ambiguous),
+        _sample(specials_pool, special_count),
+        _sample(mixed_pool, mixed_count),
+    )
+    suffix_parts = [group.decode("ascii") for group in suffix_groups if group]
 
-    if separator:
-        return separator.join([base, *suffix_parts])
-    return base + "".join(suffix_parts)
+    # An empty separator degrades to plain concatenation.
+    return separator.join([*selected_words, *suffix_parts])
 
 
 def main() -> None:
@@ -511,12 +566,27 @@ def main() -> None:
 
     try:
         config = gather_configuration(args)
-        if not config.use_words:
-            ensure_length_valid(
+        # generate_character_password re-checks the length budget itself;
+        # gather_configuration already guarantees the passphrase counts.
+        if config.use_words:
+            words = load_wordlist(config.wordlist_path)
+            password = generate_passphrase(
+                word_count=config.word_count,
+                words=words,
+                separator=config.word_separator,
+                digit_count=config.passphrase_digit_count,
+                special_count=config.passphrase_special_count,
+                mixed_count=config.passphrase_mixed_count,
+                randomize_word_capitalization=config.randomize_word_capitalization,
+                exclude_ambiguous=config.exclude_ambiguous,
+            )
+        else:
+            password = generate_character_password(
                 config.length,
                 config.special_count,
                 config.digit_count,
                 config.mixed_case_count,
+                config.exclude_ambiguous,
             )
     except KeyboardInterrupt:
         print("\nAborted.")
@@ -525,46 +595,33 @@ def main() -> None:
         print(f"\nError: {exc}")
         return
 
-    print("\nPassword configuration:")
-    print(f"  Use words: {'Yes' if config.use_words else 'No'}")
-    print(f"  Exclude ambiguous: {'Yes' if config.exclude_ambiguous else 'No'}")
+    lines = [
+        "",
+        "Password configuration:",
+        f"  Use words: {'Yes' if config.use_words else 'No'}",
+        f"  Exclude ambiguous: {'Yes' if config.exclude_ambiguous else 'No'}",
+    ]
     if config.use_words:
-        print(f"  Word count: {config.word_count}")
-        print(f"  Separator: '{config.word_separator}'")
-        print(f"  Randomize uppercase positions: {'Yes' if config.randomize_word_capitalization else 'No'}")
-        print(f"  Appended numbers: {config.passphrase_digit_count}")
-        print(f"  Appended specials: {config.passphrase_special_count}")
-        print(f"  Appended mixed-case letters: {config.passphrase_mixed_count}")
+        lines += [
+            f"  Word count: {config.word_count}",
+            f"  Separator: '{config.word_separator}'",
+            f"  Randomize uppercase positions: {'Yes' if config.randomize_word_capitalization else 'No'}",
+            f"  Appended numbers: {config.passphrase_digit_count}",
+            f"  Appended specials: {config.passphrase_special_count}",
+            f"  Appended mixed-case letters: {config.passphrase_mixed_count}",
+        ]
     else:
-        print(f"  Length: {config.length}")
-        print(f"  Special characters required: {config.special_count}")
-        print(f"  Numbers required: {config.digit_count}")
-        print(f"  Mixed-case letters required: {config.mixed_case_count}")
         filler = config.length - (
             config.special_count + config.digit_count + config.mixed_case_count
         )
-        print(f"  Lowercase filler characters: {max(0, filler)}")
-
-    if config.use_words:
-        words = load_wordlist(config.wordlist_path)
-        password = generate_passphrase(
-            word_count=config.word_count,
-            words=words,
-            separator=config.word_separator,
-            digit_count=config.passphrase_digit_count,
-            special_count=config.passphrase_special_count,
-            mixed_count=config.passphrase_mixed_count,
-            randomize_word_capitalization=config.randomize_word_capitalization,
-            exclude_ambiguous=config.exclude_ambiguous,
-        )
-    else:
-        password = generate_character_password(
-            config.length,
-            config.special_count,
-            config.digit_count,
-            config.mixed_case_count,
-            config.exclude_ambiguous,
-        )
+        lines += [
+            f"  Length: {config.length}",
+            f"  Special characters required: {config.special_count}",
+            f"  Numbers required: {config.digit_count}",
+            f"  Mixed-case letters required: {config.mixed_case_count}",
+            f"  Lowercase filler characters: {max(0, filler)}",
+        ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
     print("\nGenerated password:\n")
     print(password)